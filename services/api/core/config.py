@@ -51,6 +51,10 @@ class Settings(BaseSettings):
     # Network binding settings for uvicorn ASGI server
     API_HOST: str = "0.0.0.0"  # Bind to all interfaces
     API_PORT: int = 8000
+    # Worker processes (ignored in reload mode). Keep at 1 in Kubernetes and
+    # scale with replicas: request metrics and the Prometheus registry are
+    # in-process, so extra workers would each report a partial view
+    API_WORKERS: int = 1
 
     # Database Configuration
     # PostgreSQL connection settings with connection pooling
@@ -119,4 +119,7 @@ if __name__ == "__main__":
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.DEBUG,
+        workers=1 if settings.DEBUG else settings.API_WORKERS,
+        loop="uvloop",
+        http="httptools",
     )
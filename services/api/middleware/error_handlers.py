@@ -15,7 +15,6 @@ from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Union
 import logging
 
 logger = logging.getLogger(__name__)
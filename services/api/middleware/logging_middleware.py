@@ -24,6 +24,34 @@ from ..utils.metrics import performance_metrics
 
 logger = logging.getLogger(__name__)
 
+# Standard LogRecord attributes excluded from structured "extra" output.
+# Built once so formatting a record is a set lookup per attribute.
+_RESERVED_RECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+    }
+)
+
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """
@@ -206,29 +234,7 @@ class StructuredLoggingFormatter(logging.Formatter):
 
         # Add any extra fields
         for key, value in record.__dict__.items():
-            if key not in [
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-            ]:
+            if key not in _RESERVED_RECORD_ATTRS:
                 log_data[key] = value
 
         return json.dumps(log_data)
@@ -23,14 +23,12 @@ Endpoints:
 
 from fastapi import (
     APIRouter,
-    File,
-    UploadFile,
     HTTPException,
     status,
     Depends,
     BackgroundTasks,
 )
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
 from PIL import Image
@@ -214,6 +212,28 @@ class ModelInfo(BaseModel):
     is_active: bool
 
 
+def _decode_image(image_base64: str) -> Image.Image:
+    """
+    Decode Base64 Image
+
+    CPU-bound; endpoints run it in the threadpool so decoding large
+    payloads does not block the event loop. Image.open only parses the
+    header; pixel data is decoded lazily on first access.
+
+    Args:
+        image_base64: Base64-encoded image data
+
+    Returns:
+        Image.Image: Opened PIL image
+
+    Raises:
+        ValueError: If the payload is not valid Base64
+        OSError: If the data is not a recognizable image
+    """
+    image_bytes = base64.b64decode(image_base64)
+    return Image.open(io.BytesIO(image_bytes))
+
+
 # API Endpoints
 
 
@@ -270,9 +290,8 @@ async def predict_image(
         - Uses caching for repeated images
     """
     try:
-        # Decode image
-        image_bytes = base64.b64decode(request.image_base64)
-        image = Image.open(io.BytesIO(image_bytes))
+        # Decode image off the event loop
+        image = await run_in_threadpool(_decode_image, request.image_base64)
 
         # Validate image
         if image.size[0] < 32 or image.size[1] < 32:
@@ -303,7 +322,8 @@ async def predict_image(
 
         return result
 
-    except ValueError as e:
+    except (ValueError, OSError) as e:
+        # OSError covers PIL.UnidentifiedImageError for non-image payloads
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid image data: {str(e)}",
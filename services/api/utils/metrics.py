@@ -56,6 +56,7 @@ class PerformanceMetrics:
         # Counters
         self.total_requests = 0
         self.total_errors = 0
+        self.window_errors = 0  # Failed requests currently in the window
         self.start_time = time.time()
 
         # Thread safety
@@ -76,6 +77,14 @@ class PerformanceMetrics:
             when window size is exceeded.
         """
         with self.lock:
+            # Keep the windowed error count in step with the evicted entry
+            # (a zero-size window never holds entries, so nothing to count)
+            if self.window_size:
+                if len(self.successes) == self.window_size and not self.successes[0]:
+                    self.window_errors -= 1
+                if not success:
+                    self.window_errors += 1
+
             self.latencies.append(latency_ms)
             self.timestamps.append(time.time())
             self.successes.append(success)
@@ -103,7 +112,22 @@ class PerformanceMetrics:
         if not data:
             return 0.0
 
-        sorted_data = sorted(data)
+        return self._percentile_of_sorted(sorted(data), percentile)
+
+    @staticmethod
+    def _percentile_of_sorted(sorted_data: List[float], percentile: float) -> float:
+        """
+        Calculate Percentile of Pre-sorted Data
+
+        Lets callers sort a window once and read several percentiles from it.
+
+        Args:
+            sorted_data: Non-empty list of values in ascending order
+            percentile: Percentile to calculate (0-100)
+
+        Returns:
+            float: Percentile value
+        """
         index = (len(sorted_data) - 1) * (percentile / 100)
 
         if index.is_integer():
@@ -148,13 +172,14 @@ class PerformanceMetrics:
                     "window_size": 0,
                 }
 
-            latencies_list = list(self.latencies)
+            # Sort the window once and read every percentile from it
+            latencies_sorted = sorted(self.latencies)
 
             # Calculate latency percentiles
-            latency_mean = statistics.mean(latencies_list)
-            latency_p50 = self.get_percentile(latencies_list, 50)
-            latency_p95 = self.get_percentile(latencies_list, 95)
-            latency_p99 = self.get_percentile(latencies_list, 99)
+            latency_mean = statistics.fmean(latencies_sorted)
+            latency_p50 = self._percentile_of_sorted(latencies_sorted, 50)
+            latency_p95 = self._percentile_of_sorted(latencies_sorted, 95)
+            latency_p99 = self._percentile_of_sorted(latencies_sorted, 99)
 
             # Calculate throughput (requests per second)
             # Use recent window for accurate current throughput
@@ -168,8 +193,7 @@ class PerformanceMetrics:
                 throughput = 0.0
 
             # Calculate error rate
-            error_count = sum(1 for s in self.successes if not s)
-            error_rate = error_count / len(self.successes) if self.successes else 0.0
+            error_rate = self.window_errors / len(self.successes)
 
             return {
                 "latency_mean_ms": round(latency_mean, 2),
@@ -192,6 +216,7 @@ class PerformanceMetrics:
             self.successes.clear()
             self.total_requests = 0
             self.total_errors = 0
+            self.window_errors = 0
             self.start_time = time.time()
 
 
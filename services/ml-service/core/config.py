@@ -11,9 +11,8 @@ Industry Standards:
 """
 
 from pydantic_settings import BaseSettings
-from typing import List, Dict, Optional
+from typing import List, Dict, Literal, Optional
 from functools import lru_cache
-from pathlib import Path
 
 
 class MLSettings(BaseSettings):
@@ -46,8 +45,10 @@ class MLSettings(BaseSettings):
     # Model Serving Configuration
     BATCH_SIZE: int = 32  # Inference batch size
     MAX_BATCH_WAIT_TIME: float = 0.1  # Max wait time for batching (seconds)
-    INFERENCE_DEVICE: str = "cuda"  # cuda, cpu, mps
+    INFERENCE_DEVICE: str = "cuda"  # cuda, cuda:N, cpu, mps
     ENABLE_MIXED_PRECISION: bool = True  # FP16 inference for speed
+    MIXED_PRECISION_DTYPE: Literal["float16", "bfloat16"] = "float16"  # bfloat16: Ampere+
+    ENABLE_CHANNELS_LAST: bool = True  # NHWC layout for conv backbones (CUDA)
 
     # Model Versioning & A/B Testing
     ENABLE_AB_TESTING: bool = False
@@ -65,6 +66,10 @@ class MLSettings(BaseSettings):
     ENABLE_ONNX: bool = False  # Use ONNX Runtime for inference
     ENABLE_TENSORRT: bool = False  # Use TensorRT optimization
     ENABLE_MODEL_COMPILATION: bool = False  # PyTorch 2.0 compile
+    MODEL_COMPILE_MODE: str = "reduce-overhead"  # default, reduce-overhead, max-autotune
+    ENABLE_TORCHSCRIPT: bool = False  # Frozen TorchScript (instead of compile)
+    ENABLE_BN_FUSION: bool = True  # Fold BatchNorm into preceding Conv layers
+    ENABLE_QUANTIZATION: bool = False  # Dynamic INT8 quantization (CPU only)
 
     # Caching Configuration
     ENABLE_PREDICTION_CACHE: bool = True
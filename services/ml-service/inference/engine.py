@@ -18,7 +18,6 @@ Architecture:
 """
 
 import torch
-import torch.nn as nn
 from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
 from PIL import Image
@@ -230,6 +229,82 @@ class InferenceEngine:
 
         return tensor, image_hash
 
+    def _prepare_input(self, tensor: torch.Tensor) -> torch.Tensor:
+        """
+        Prepare Batch Tensor for Inference
+
+        Moves a preprocessed batch to the inference device and matches
+        the precision and memory format of the loaded model.
+
+        Args:
+            tensor: Batch tensor (batch_size, 3, H, W) on CPU
+
+        Returns:
+            torch.Tensor: Batch tensor ready for the model
+        """
+        if model_manager.use_onnx:
+            # ONNX Runtime reads the FP32 host buffer directly
+            return tensor
+
+        tensor = tensor.to(self.device)
+
+        if model_manager.use_half_precision:
+            tensor = tensor.to(model_manager.half_dtype)
+
+        if model_manager.use_channels_last:
+            tensor = tensor.contiguous(memory_format=torch.channels_last)
+
+        return tensor
+
+    def _pad_batch(self, tensor: torch.Tensor) -> torch.Tensor:
+        """
+        Pad Batch to a Compiled Batch Size
+
+        Zero-pads a CPU batch up to the next static batch size of the
+        compiled model, so variable cache-miss counts never trigger a
+        recompile or CUDA graph capture on the request path.
+
+        Args:
+            tensor: Batch tensor (batch_size, 3, H, W) on CPU
+
+        Returns:
+            torch.Tensor: Batch padded along dim 0 (unchanged when eager)
+        """
+        batch_size = tensor.size(0)
+        padded_size = model_manager.get_padded_batch_size(batch_size)
+        if padded_size == batch_size:
+            return tensor
+
+        padding = tensor.new_zeros((padded_size - batch_size, *tensor.shape[1:]))
+        return torch.cat([tensor, padding])
+
+    def _forward(
+        self, model: torch.nn.Module, batch: torch.Tensor, batch_size: int
+    ) -> torch.Tensor:
+        """
+        Run Model Forward Pass
+
+        Compiled models are fed chunks of at most BATCH_SIZE (their largest
+        warmed shape) and the rows added by _pad_batch are dropped.
+
+        Args:
+            model: Model to run
+            batch: Prepared (possibly padded) batch tensor
+            batch_size: Number of real images in the batch
+
+        Returns:
+            torch.Tensor: Logits (batch_size, num_classes)
+        """
+        if not model_manager.use_compilation:
+            return model(batch)
+
+        # torch.cat also copies out of CUDA graph output buffers, which the
+        # next replay would overwrite
+        logits = torch.cat(
+            [model(chunk) for chunk in batch.split(ml_settings.BATCH_SIZE)]
+        )
+        return logits[:batch_size]
+
     def _postprocess_output(
         self, logits: torch.Tensor, inference_time: float
     ) -> List[Dict[str, Any]]:
@@ -245,27 +320,27 @@ class InferenceEngine:
         Returns:
             List of prediction dictionaries
         """
-        # Apply softmax
-        probabilities = torch.softmax(logits, dim=1)
-
-        # Get top predictions
+        # Softmax on device, then a single D2H copy for the whole batch
+        # instead of one synchronizing .item() per class
+        probabilities = torch.softmax(logits.float(), dim=1).cpu()
         confidences, predicted_classes = torch.max(probabilities, dim=1)
 
-        results = []
-        for i in range(logits.size(0)):
-            pred_class = predicted_classes[i].item()
-            confidence = confidences[i].item()
+        species = ml_settings.SUPPORTED_SPECIES
+        prob_rows = probabilities.tolist()
+        confidences = confidences.tolist()
+        predicted_classes = predicted_classes.tolist()
 
+        results = []
+        for pred_class, confidence, probs in zip(
+            predicted_classes, confidences, prob_rows
+        ):
             # Get all class probabilities
-            all_probs = {
-                ml_settings.SUPPORTED_SPECIES[j]: float(probabilities[i, j].item())
-                for j in range(len(ml_settings.SUPPORTED_SPECIES))
-            }
+            all_probs = dict(zip(species, probs))
 
             result = {
-                "species": ml_settings.SUPPORTED_SPECIES[pred_class],
+                "species": species[pred_class],
                 "species_id": pred_class,
-                "confidence": float(confidence),
+                "confidence": confidence,
                 "all_probabilities": all_probs,
                 "inference_time_ms": inference_time * 1000,
                 "model_version": ml_settings.ACTIVE_MODEL_VERSION,
@@ -276,7 +351,7 @@ class InferenceEngine:
 
         return results
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def predict(
         self, image: Image.Image, model_version: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -320,14 +395,11 @@ class InferenceEngine:
         model = model_manager.get_model(model_version)
 
         # Add batch dimension and move to device
-        tensor = tensor.unsqueeze(0).to(self.device)
-
-        if ml_settings.ENABLE_MIXED_PRECISION:
-            tensor = tensor.half()
+        tensor = self._prepare_input(self._pad_batch(tensor.unsqueeze(0)))
 
         # Inference
         inference_start = time.time()
-        logits = model(tensor)
+        logits = self._forward(model, tensor, 1)
         inference_time = time.time() - inference_start
 
         # Postprocess
@@ -352,9 +424,12 @@ class InferenceEngine:
 
         return result
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def predict_batch(
-        self, images: List[Image.Image], model_version: Optional[str] = None
+        self,
+        images: List[Image.Image],
+        model_version: Optional[str] = None,
+        use_cache: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Predict Batch of Images
@@ -364,6 +439,8 @@ class InferenceEngine:
         Args:
             images: List of PIL Image objects
             model_version: Optional model version
+            use_cache: Read and populate the prediction cache (disable for
+                synthetic inputs such as benchmarks)
 
         Returns:
             List of prediction dictionaries
@@ -380,6 +457,7 @@ class InferenceEngine:
             Significantly faster than individual predictions
         """
         start_time = time.time()
+        use_cache = use_cache and ml_settings.ENABLE_PREDICTION_CACHE
 
         # Preprocess all images
         tensors = []
@@ -391,7 +469,7 @@ class InferenceEngine:
             tensor, image_hash = self._preprocess_image(image)
 
             # Check cache
-            if ml_settings.ENABLE_PREDICTION_CACHE:
+            if use_cache:
                 cached_result = self.cache.get(image_hash)
                 if cached_result is not None:
                     cached_results.append((idx, cached_result))
@@ -406,24 +484,21 @@ class InferenceEngine:
             return [result for _, result in sorted(cached_results)]
 
         # Stack tensors into batch
-        batch_tensor = torch.stack(tensors).to(self.device)
-
-        if ml_settings.ENABLE_MIXED_PRECISION:
-            batch_tensor = batch_tensor.half()
+        batch_tensor = self._prepare_input(self._pad_batch(torch.stack(tensors)))
 
         # Get model
         model = model_manager.get_model(model_version)
 
         # Batch inference
         inference_start = time.time()
-        logits = model(batch_tensor)
+        logits = self._forward(model, batch_tensor, len(tensors))
         inference_time = time.time() - inference_start
 
         # Postprocess
         batch_results = self._postprocess_output(logits, inference_time / len(tensors))
 
         # Cache results
-        if ml_settings.ENABLE_PREDICTION_CACHE:
+        if use_cache:
             for image_hash, result in zip(image_hashes, batch_results):
                 self.cache.put(image_hash, result)
 
@@ -470,7 +545,9 @@ class InferenceEngine:
             "average_inference_time_ms": avg_time * 1000,
             "cache_stats": self.cache.get_stats(),
             "device": str(self.device),
-            "mixed_precision_enabled": ml_settings.ENABLE_MIXED_PRECISION,
+            "mixed_precision_enabled": model_manager.use_half_precision,
+            "mixed_precision_dtype": str(model_manager.half_dtype),
+            "quantization_enabled": model_manager.use_quantization,
         }
 
     def clear_cache(self) -> None:
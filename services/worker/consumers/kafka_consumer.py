@@ -23,9 +23,8 @@ from kafka import KafkaConsumer, KafkaProducer
 from kafka.errors import KafkaError
 import json
 import logging
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional
 import signal
-import sys
 from threading import Event
 import time
 from datetime import datetime
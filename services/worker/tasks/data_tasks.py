@@ -11,12 +11,9 @@ Industry Standards:
     - Progress tracking
 """
 
-from celery import Task
 from celery.utils.log import get_task_logger
-from typing import Dict, Any, List
+from typing import Dict, Any
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
 
 from ..celery_app import celery_app
 
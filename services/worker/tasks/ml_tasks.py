@@ -18,7 +18,7 @@ Task Types:
     - Performance benchmarking
 """
 
-from celery import Task, group, chord
+from celery import Task, group
 from celery.utils.log import get_task_logger
 from typing import Dict, List, Any, Optional
 import time
@@ -377,10 +377,8 @@ def benchmark_model(
         # Load model
         model = self.model_manager.get_model(model_version)
 
-        # Generate dummy data
-        dummy_images = [
-            Image.new("RGB", (224, 224), color="red") for _ in range(num_samples)
-        ]
+        # Unseeded generator so every run measures fresh inputs
+        rng = np.random.default_rng()
 
         results = {
             "model_version": model_version,
@@ -392,26 +390,39 @@ def benchmark_model(
         for batch_size in batch_sizes:
             latencies = []
 
+            # Fresh dummy data per batch size, from a single uint8 buffer
+            pixels = rng.integers(
+                0, 256, size=(num_samples, 224, 224, 3), dtype=np.uint8
+            )
+            dummy_images = [Image.fromarray(frame) for frame in pixels]
+
             # Run multiple iterations
             for i in range(0, num_samples, batch_size):
                 batch = dummy_images[i : i + batch_size]
 
                 start = time.time()
-                _ = self.inference_engine.predict_batch(batch)
+                # Bypass the prediction cache: random inputs would only evict
+                # real entries, and lookups/stores are not model latency
+                _ = self.inference_engine.predict_batch(
+                    batch, model_version=model_version, use_cache=False
+                )
                 latency = (time.time() - start) * 1000  # Convert to ms
 
                 latencies.append(latency)
 
-            # Calculate statistics
-            latencies_sorted = sorted(latencies)
-            n = len(latencies_sorted)
+            # Calculate statistics in one vectorized pass
+            latencies_arr = np.asarray(latencies)
+            latency_mean = float(latencies_arr.mean())
+            p50, p95, p99 = np.percentile(
+                latencies_arr, [50, 95, 99], method="higher"
+            ).tolist()
 
             results["batch_results"][f"batch_{batch_size}"] = {
-                "latency_mean_ms": np.mean(latencies),
-                "latency_p50_ms": latencies_sorted[int(n * 0.5)],
-                "latency_p95_ms": latencies_sorted[int(n * 0.95)],
-                "latency_p99_ms": latencies_sorted[int(n * 0.99)],
-                "throughput_imgs_per_sec": batch_size / (np.mean(latencies) / 1000),
+                "latency_mean_ms": latency_mean,
+                "latency_p50_ms": p50,
+                "latency_p95_ms": p95,
+                "latency_p99_ms": p99,
+                "throughput_imgs_per_sec": batch_size / (latency_mean / 1000),
             }
 
         # Add GPU memory stats if available
@@ -0,0 +1,72 @@
+"""
+Performance Metrics Unit Tests
+
+Tests for the sliding-window PerformanceMetrics tracker.
+
+Industry Standards:
+    - AAA pattern (Arrange, Act, Assert)
+    - Descriptive test names
+    - Isolated test cases
+"""
+
+import random
+
+from services.api.utils.metrics import PerformanceMetrics
+
+
+class TestPerformanceMetricsErrorRate:
+    """Test suite for windowed error-rate tracking"""
+
+    def test_error_rate_matches_recount_after_window_wraps(self):
+        """
+        Test: Incremental error count matches a full recount
+
+        Records well past the window size with mixed outcomes so that both
+        failed and successful entries get evicted.
+        """
+        # Arrange
+        metrics = PerformanceMetrics(window_size=50)
+        rng = random.Random(42)
+
+        for _ in range(500):
+            # Act
+            metrics.record_request(rng.uniform(1, 100), success=rng.random() > 0.3)
+
+            # Assert
+            recount = sum(1 for s in metrics.successes if not s)
+            assert metrics.window_errors == recount
+
+        expected_rate = recount / len(metrics.successes)
+        assert metrics.get_stats()["error_rate"] == round(expected_rate, 4)
+
+    def test_reset_clears_window_errors(self):
+        """
+        Test: Reset clears the windowed error count
+        """
+        # Arrange
+        metrics = PerformanceMetrics(window_size=10)
+        for _ in range(5):
+            metrics.record_request(10.0, success=False)
+
+        # Act
+        metrics.reset()
+        metrics.record_request(10.0, success=True)
+
+        # Assert
+        assert metrics.window_errors == 0
+        assert metrics.get_stats()["error_rate"] == 0.0
+
+    def test_zero_window_size_records_without_error(self):
+        """
+        Test: A zero-size window accepts requests without tracking them
+        """
+        # Arrange
+        metrics = PerformanceMetrics(window_size=0)
+
+        # Act
+        metrics.record_request(10.0, success=False)
+
+        # Assert
+        assert metrics.window_errors == 0
+        assert metrics.total_errors == 1
+        assert metrics.get_stats()["window_size"] == 0